@@ -1,6 +1,8 @@
 """
 Dispatcher for updating the store
 """
+import json
+
 from ..store.app_store import AppStore
 from ..utils.logging import log
 
@@ -76,6 +78,8 @@ class Dispatcher:
                 "loading": False
             })
         elif action_type == "SELECT_GEO_OBJECT":
+            if isinstance(payload, str):
+                payload = json.loads(payload)
             self._store.update_state({"selected_object": payload})
         
         elif action_type == "TOGGLE_INFO_PANEL":
@@ -113,6 +117,8 @@ class Dispatcher:
             self._store.update_state({"geo_objects": payload, "loading": False})
 
         elif action_type == "SELECT_OBJECT":
+            if isinstance(payload, str):
+                payload = json.loads(payload)
             self._store.update_state({"selected_object": payload, "loading": False})
 
         elif action_type == "SET_MAP_VIEW":
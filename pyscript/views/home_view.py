@@ -5,11 +5,56 @@ import logging
 
 import js
 import asyncio
-from pyodide.ffi import create_proxy
+from pyodide.ffi import create_proxy, create_once_callable
+from pyodide.ffi.wrappers import add_event_listener, remove_event_listener
 from ..store.app_store import AppStore
 from ..actions.city_actions import CityActions
+from ..dispatch.dispatcher import Dispatcher
+from ..config import CITY_POSITIONS
 from ..utils.logging import warn, log
 
+_FIELDS = {
+    "ru": ("name_ru", "country_ru", "foundation_ru", "description_ru"),
+    "en": ("name", "country", "foundation", "description")
+}
+
+_SIGNATURE_FIELDS = _FIELDS["en"] + _FIELDS["ru"]
+
+_HTML_ESCAPE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#39;"
+})
+
+
+def _esc(text):
+    """Escape text for interpolation into HTML markup"""
+    return str(text).translate(_HTML_ESCAPE) if text else ""
+
+
+_LABELS = {
+    "ru": {
+        "country": "Страна:",
+        "founded": "Основан:",
+        "select": "Выберите город",
+        "click": "Нажмите на город, чтобы просмотреть информацию."
+    },
+    "en": {
+        "country": "Country:",
+        "founded": "Founded:",
+        "select": "Select a City",
+        "click": "Click on a city to view information."
+    }
+}
+
+_CITY_TPL = (
+    '<div class="city-detail"><div class="city-detail-label">{country_label}</div><div>{country}</div></div>'
+    '<div class="city-detail"><div class="city-detail-label">{founded_label}</div><div>{founded}</div></div>'
+    '<div class="city-description">{description}</div>'
+)
+
 class HomeView:
     """Home view with city selection and mode selection"""
 
@@ -41,13 +86,22 @@ class HomeView:
         self.start_btn = js.document.getElementById(start_btn_id)
 
         self.store = AppStore()
-        self.cities = dict()
+        self._dispatcher = Dispatcher()
+        self._names = {lang: {} for lang in _FIELDS}
         self.selected_city_id = None
+        self._selected_city_data = None
         self.selected_mode_id = 1
+        self._resize_pending = False
+        self._geom_cache = None
+        self._translatable = []
+        self._last_view = None
+        self._listeners = []
 
         self.city_markers = {}
+        self._city_sig = {}
+        self._last_cities = None
         self.unsubscribe = None
-        self._handlers = {}
+        self._state_change_handler = None
 
     def initialize(self):
         """Initialize the component and load cities"""
@@ -60,58 +114,108 @@ class HomeView:
             return
 
         self._setup_event_handlers()
+        self._collect_translatable_elements()
+
+        self._listen(js.window, "resize", self._on_window_resize)
+
+        self._subscribe()
 
-        self._resize_handler = create_proxy(self._on_window_resize)
-        js.window.addEventListener("resize", self._resize_handler)
+        self._fetch_cities()
+
+    def _subscribe(self):
+        """Subscribe to store updates, releasing any previous subscription and its proxy"""
+        self._release_subscription()
 
         self._state_change_handler = create_proxy(self.on_state_change)
         self.unsubscribe = self.store.subscribe(self._state_change_handler)
 
-        self._fetch_cities()
+    def _release_subscription(self):
+        """Remove the store subscription, then destroy the proxy it was calling"""
+        # Unsubscribing first guarantees the store never calls a destroyed proxy
+        if self.unsubscribe:
+            self.unsubscribe()
+            self.unsubscribe = None
+
+        if self._state_change_handler is not None:
+            self._state_change_handler.destroy()
+            self._state_change_handler = None
+
+    def _listen(self, target, event_name, handler):
+        """Add an event listener and remember it so cleanup can remove it"""
+        add_event_listener(target, event_name, handler)
+        self._listeners.append((target, event_name, handler))
+
+    def _collect_translatable_elements(self):
+        """Cache translatable elements together with their texts in every language"""
+        self._translatable = []
+
+        elements = js.document.querySelectorAll('[data-en], [data-ru]')
+        for element in elements:
+            texts = {lang: element.getAttribute('data-' + lang) for lang in _FIELDS}
+            self._translatable.append((element, texts))
+
+    def _get_current_lang(self):
+        """Get the current document language; other views can switch it too"""
+        return js.document.documentElement.lang or "en"
 
     def _on_window_resize(self, event):
-        """Handle window resize event"""
-        current_lang = js.document.documentElement.lang or "en"
+        """Handle window resize event, coalescing bursts into one update per frame"""
+        if self._resize_pending:
+            return
+
+        self._resize_pending = True
+        js.window.requestAnimationFrame(create_once_callable(self._do_resize))
+
+    def _do_resize(self, timestamp):
+        """Reposition city markers after the window has been resized"""
+        self._resize_pending = False
+        self._geom_cache = None
+
+        geom = self._compute_map_geometry()
 
         for city_id, marker in self.city_markers.items():
-            city = self.cities[city_id]
-            city_name = city.get("name_ru" if current_lang == "ru" else "name")
-            from ..config import CITY_POSITIONS
             if city_id in CITY_POSITIONS:
                 position = CITY_POSITIONS.get(city_id)
-                self._update_marker_position(marker, position)
+                self._update_marker_position(marker, position, geom)
         self._update_city_selection()
 
     def _setup_event_handlers(self):
         """Set up event handlers for UI elements"""
 
-        lang_buttons = js.document.querySelectorAll('.lang-btn')
-        for i in range(lang_buttons.length):
-            button = lang_buttons.item(i)
-            lang = button.getAttribute('data-lang')
+        lang_switcher = self.screen.querySelector('.language-switcher')
+        if lang_switcher:
+            self._listen(lang_switcher, 'click', self._on_lang_switcher_click)
 
-            handler = create_proxy(lambda event, lang=lang: self._on_language_change(event, lang))
-            self._handlers[f"lang_{lang}"] = handler
+        mode_options = self.screen.querySelectorAll('.mode-option')
+        for i, option in enumerate(mode_options):
+            option.setAttribute('data-mode-id', str(i + 1))
 
-            button.addEventListener('click', handler)
+        self._listen(self.screen, 'click', self._on_screen_click)
+        self._listen(self.markers_container, 'click', self._on_markers_container_click)
 
-        mode_options = self.screen.querySelectorAll('.mode-option')
-        for i in range(mode_options.length):
-            option = mode_options.item(i)
-            mode_id = i + 1
+    def _on_markers_container_click(self, event):
+        """Dispatch a click inside the markers container to the clicked city marker"""
+        marker = event.target.closest('.city-marker')
+        if marker:
+            self._on_city_click(event, int(marker.getAttribute('data-city-id')))
 
-            handler = create_proxy(lambda event, mode_id=mode_id: self._on_mode_select(event, mode_id))
-            self._handlers[f"mode_{mode_id}"] = handler
+    def _on_screen_click(self, event):
+        """Dispatch a click inside the home screen to the clicked mode option and start button"""
+        option = event.target.closest('.mode-option')
+        if option:
+            self._on_mode_select(event, int(option.getAttribute('data-mode-id')))
 
-            option.addEventListener('click', handler)
+        if event.target.closest(f'#{self.start_btn_id}'):
+            self._on_start_simulation(event)
 
-        start_handler = create_proxy(self._on_start_simulation)
-        self._handlers["start"] = start_handler
-        self.start_btn.addEventListener('click', start_handler)
+    def _on_lang_switcher_click(self, event):
+        """Dispatch a click inside the language switcher to the clicked language button"""
+        button = event.target.closest('.lang-btn')
+        if button:
+            self._on_language_change(event, button.getAttribute('data-lang'))
 
     def _fetch_cities(self):
         """Fetch cities from the API"""
-        import asyncio
         asyncio.ensure_future(CityActions.fetch_cities())
 
     def on_state_change(self, state):
@@ -121,81 +225,147 @@ class HomeView:
         Args:
             state: Current application state
         """
+        current_view = state.get("current_view", "home")
+        if current_view == "home" and self._last_view != "home":
+            # Other screens add or rewrite translatable elements, and can switch
+            # the language, while this one is hidden
+            self._collect_translatable_elements()
+            self._sync_lang_buttons(self._get_current_lang())
+        self._last_view = current_view
+
         new_cities = state.get("cities", [])
-        bool_need_render = False
-        for city in new_cities:
-            if city['id'] not in self.cities or self.cities[city['id']] != city:
-                bool_need_render = True
-                self.cities[city['id']] = city
-        if bool_need_render and "home" == state.get("current_view", "home"):
-            self._render_city_markers()
+        if new_cities is not self._last_cities and "home" == current_view:
+            self._last_cities = new_cities
+            self._sync_cities(new_cities)
+
+        self._sync_selection(state)
 
+    def _sync_cities(self, new_cities):
+        """
+        Update city markers to match the list of cities from the store
 
+        Args:
+            new_cities: List of cities from the store
+        """
+        changed_ids = set()
+        for city in new_cities:
+            city_id = city['id']
+            signature = tuple(map(city.get, _SIGNATURE_FIELDS))
+            if self._city_sig.get(city_id) != signature:
+                changed_ids.add(city_id)
+                self._city_sig[city_id] = signature
+                for lang, fields in _FIELDS.items():
+                    self._names[lang][city_id] = city.get(fields[0])
+
+        # Cities without a CITY_POSITIONS entry have no marker but are cached too
+        new_city_ids = {city['id'] for city in new_cities}
+        removed_ids = {city_id for city_id in self._city_sig if city_id not in new_city_ids}
+        for city_id in removed_ids:
+            for names in self._names.values():
+                names.pop(city_id, None)
+            self._city_sig.pop(city_id, None)
+
+        if changed_ids or removed_ids:
+            self._render_city_markers(changed_ids, removed_ids)
+
+    def _sync_selection(self, state):
+        """
+        Update the selected city marker and info panel from the store
+
+        Args:
+            state: Current application state
+        """
         new_selected_city_id = state.get("selected_city_id")
-        if new_selected_city_id != self.selected_city_id:
-            self.cities[new_selected_city_id] = state.get("selected_city_data")
+        new_selected_city_data = state.get("selected_city_data")
+
+        selection_changed = new_selected_city_id != self.selected_city_id
+        if not selection_changed and new_selected_city_data is self._selected_city_data:
+            return
+
+        self._selected_city_data = new_selected_city_data
+
+        if selection_changed:
             self.selected_city_id = new_selected_city_id
             self._update_city_selection()
             self._update_city_info()
             self._update_start_button()
+        else:
+            self._update_city_info()
+
+    def _render_city_markers(self, changed_ids, removed_ids=()):
+        """
+        Add, update and remove city markers on the map with dynamic positioning
 
-    def _render_city_markers(self):
-        """Render markers for all cities on the map with dynamic positioning"""
+        Args:
+            changed_ids: IDs of cities that are new or whose data changed
+            removed_ids: IDs of cities whose markers should be removed
+        """
 
         log("render city markers")
-        self.markers_container.innerHTML = ""
-        self.city_markers = {}
 
-        from ..config import CITY_POSITIONS
+        for city_id in removed_ids:
+            marker = self.city_markers.pop(city_id, None)
+            if marker:
+                marker.remove()
+
+        if not changed_ids:
+            return
 
-        current_lang = js.document.documentElement.lang or "en"
+        current_lang = self._get_current_lang()
+        names = self._names[current_lang if current_lang in _FIELDS else "en"]
 
-        for city_id, city in self.cities.items():
-            city_name = city.get("name_ru" if current_lang == "ru" else "name")
+        geom = self._compute_map_geometry()
 
+        parts = []
+        for city_id in changed_ids:
             if city_id not in CITY_POSITIONS:
                 continue
 
-            marker = js.document.createElement("div")
-            marker.className = "city-marker"
-            marker.setAttribute("data-city-id", str(city_id))
-
+            city_name = names.get(city_id)
             position = CITY_POSITIONS.get(city_id, {"left": 50, "top": 50})
-            
-            self._update_marker_position(marker, position)
 
-            label = js.document.createElement("div")
-            label.className = "city-marker-label"
-            label.textContent = city_name
+            marker = self.city_markers.get(city_id)
+            if marker:
+                label = marker.querySelector('.city-marker-label')
+                if label:
+                    label.textContent = city_name or ""
+                self._update_marker_position(marker, position, geom)
+                continue
+
+            left, top = self._get_marker_position(position, geom)
+            active = " active" if self.selected_city_id == city_id else ""
 
-            handler = create_proxy(lambda event, city_id=city_id: self._on_city_click(event, city_id))
-            self._handlers[f"city_{city_id}"] = handler
-            marker.addEventListener("click", handler)
+            parts.append(
+                f'<div class="city-marker{active}" data-city-id="{city_id}" style="left:{left}%;top:{top}%">'
+                f'<div class="city-marker-label">{_esc(city_name)}</div>'
+                f'</div>'
+            )
 
-            marker.appendChild(label)
-            self.markers_container.appendChild(marker)
+        if not parts:
+            return
 
-            if self.selected_city_id == city_id:
-                marker.classList.add("active")
+        self.markers_container.insertAdjacentHTML("beforeend", "".join(parts))
 
-            self.city_markers[city_id] = marker
+        markers = self.markers_container.querySelectorAll('.city-marker')
+        for marker in markers:
+            self.city_markers[int(marker.getAttribute('data-city-id'))] = marker
 
-    def _update_marker_position(self, marker, position):
+    def _compute_map_geometry(self):
         """
-        Update marker position based on the actual map display area
-        
-        Args:
-            marker: The DOM element for the marker
-            position: Original position info with 'left' and 'top' in percentages
+        Measure the displayed map image inside the markers area.
+        The result is cached until the window is resized or the view is shown again.
+
+        Returns:
+            Tuple of (h_offset, v_offset, actual_width, actual_height,
+            container_width, container_height) or None if the map is not in the DOM
         """
+        if self._geom_cache is not None:
+            return self._geom_cache
+
         map_inner = js.document.querySelector('.map-inner')
         if not map_inner:
-            marker.style.left = f"{position['left']}%"
-            marker.style.top = f"{position['top']}%"
-            return
-        
-        computed_style = js.window.getComputedStyle(map_inner)
-        
+            return None
+
         map_rect = map_inner.getBoundingClientRect()
         container_width = map_rect.width
         container_height = map_rect.height
@@ -221,72 +391,77 @@ class HomeView:
             actual_height = actual_width / aspect_ratio
             h_offset = 0
             v_offset = (container_height - actual_height) / 2
-        x_percent = position['left']
-        y_percent = position['top']
-        
-        adjusted_left = h_offset + (x_percent / 100 * actual_width)
-        adjusted_top = v_offset + (y_percent / 100 * actual_height)
+
+        geom = (h_offset, v_offset, actual_width, actual_height, container_width, container_height)
+        if container_width and container_height:
+            self._geom_cache = geom
+        return geom
+
+    def _get_marker_position(self, position, geom):
+        """
+        Calculate marker position based on the actual map display area
+
+        Args:
+            position: Original position info with 'left' and 'top' in percentages
+            geom: Map geometry from _compute_map_geometry
+
+        Returns:
+            Tuple of (left, top) in percentages of the markers container
+        """
+        if geom is None:
+            return position['left'], position['top']
+
+        h_offset, v_offset, actual_width, actual_height, container_width, container_height = geom
+
+        adjusted_left = h_offset + (position['left'] / 100 * actual_width)
+        adjusted_top = v_offset + (position['top'] / 100 * actual_height)
         
         final_left = (adjusted_left / container_width) * 100
         final_top = (adjusted_top / container_height) * 100
         
-        marker.style.left = f"{final_left}%"
-        marker.style.top = f"{final_top}%"
+        return final_left, final_top
+
+    def _update_marker_position(self, marker, position, geom):
+        """
+        Update marker position based on the actual map display area
+        
+        Args:
+            marker: The DOM element for the marker
+            position: Original position info with 'left' and 'top' in percentages
+            geom: Map geometry from _compute_map_geometry
+        """
+        final_left, final_top = self._get_marker_position(position, geom)
+
+        marker.style.cssText = f"left:{final_left}%;top:{final_top}%"
 
 
     def _update_city_selection(self):
         """Update visual selection of cities on the map"""
         for marker_id, marker in self.city_markers.items():
-            marker.classList.remove("active")
-
-        if self.selected_city_id in self.city_markers:
-            self.city_markers[self.selected_city_id].classList.add("active")
+            marker.classList.toggle("active", marker_id == self.selected_city_id)
 
     def _update_city_info(self):
         """Update city information panel"""
-        selected_city = self.cities[self.selected_city_id]
+        selected_city = self._selected_city_data if self.selected_city_id is not None else None
 
-        current_lang = js.document.documentElement.lang or "en"
-        is_russian = current_lang == "ru"
+        current_lang = self._get_current_lang()
+        if current_lang not in _FIELDS:
+            current_lang = "en"
+        name_k, country_k, founded_k, desc_k = _FIELDS[current_lang]
+        labels = _LABELS[current_lang]
 
         if selected_city:
-            city_name = selected_city.get("name_ru" if is_russian else "name", "Unknown City")
-            self.info_title.textContent = city_name
-
-            content_html = ""
-
-            country_label = "Страна:" if is_russian else "Country:"
-            country = selected_city.get("country_ru" if is_russian else "country", "Unknown")
-            content_html += f"""
-            <div>
-                <div>{country_label}</div>
-                <div>{country}</div>
-            </div>
-            """
-
-            founded_label = "Основан:" if is_russian else "Founded:"
-            founded = selected_city.get("foundation_ru" if is_russian else "foundation", "Unknown")
-            content_html += f"""
-            <div>
-                <div>{founded_label}</div>
-                <div>{founded}</div>
-            </div>
-            """
-
-            description = selected_city.get("description_ru" if is_russian else "description", "No description available.")
-            content_html += f"""
-            <div>
-                {description}
-            </div>
-            """
-
-            self.info_content.innerHTML = content_html
+            self.info_title.textContent = selected_city.get(name_k, "Unknown City")
+            self.info_content.innerHTML = _CITY_TPL.format(
+                country_label=labels["country"],
+                country=_esc(selected_city.get(country_k, "Unknown")),
+                founded_label=labels["founded"],
+                founded=_esc(selected_city.get(founded_k, "Unknown")),
+                description=_esc(selected_city.get(desc_k, "No description available."))
+            )
         else:
-            select_message = "Выберите город" if is_russian else "Select a City"
-            click_message = "Нажмите на город, чтобы просмотреть информацию." if is_russian else "Click on a city to view information."
-
-            self.info_title.textContent = select_message
-            self.info_content.innerHTML = f"<p>{click_message}</p>"
+            self.info_title.textContent = labels["select"]
+            self.info_content.innerHTML = f"<p>{labels['click']}</p>"
 
     def _update_start_button(self):
         """Update start simulation button state"""
@@ -304,8 +479,7 @@ class HomeView:
         else:
             self.start_btn.style.display = "none"
             
-            current_lang = js.document.documentElement.lang or "en"
-            is_russian = current_lang == "ru"
+            is_russian = self._get_current_lang() == "ru"
             coming_soon_message = "Моделирование для этого города будет добавлено позже." if is_russian else "Simulation for this city will be added later."
             
             existing_element = js.document.getElementById("coming-soon-message")
@@ -338,19 +512,13 @@ class HomeView:
             mode_id: ID of the selected mode
         """
         mode_options = self.screen.querySelectorAll('.mode-option')
-        for i in range(mode_options.length):
-            option = mode_options.item(i)
-            if i + 1 == mode_id:
-                option.classList.add("active")
-            else:
-                option.classList.remove("active")
+        for i, option in enumerate(mode_options):
+            option.classList.toggle("active", i + 1 == mode_id)
 
         self.selected_mode_id = mode_id
         log(f"selected_mode_id: {mode_id}")
 
-        from ..dispatch.dispatcher import Dispatcher
-        dispatcher = Dispatcher()
-        dispatcher.dispatch("SELECT_MODE_HOME", mode_id)
+        self._dispatcher.dispatch("SELECT_MODE_HOME", mode_id)
 
     def _on_start_simulation(self, event):
         """Handle start simulation button click"""
@@ -361,39 +529,32 @@ class HomeView:
         simulation_screen = js.document.getElementById("simulation-screen")
         simulation_screen.classList.add("active")
 
-        from ..dispatch.dispatcher import Dispatcher
-        dispatcher = Dispatcher()
-        dispatcher.dispatch("NAVIGATE_TO_SIMULATION", {
+        self._dispatcher.dispatch("NAVIGATE_TO_SIMULATION", {
             "city_id": self.selected_city_id,
             "mode_id": self.selected_mode_id
         })
 
+    def _sync_lang_buttons(self, lang):
+        """Mark the home screen language button for the given language as active"""
+        for button in self.screen.querySelectorAll('.lang-btn'):
+            button.classList.toggle('active', button.getAttribute('data-lang') == lang)
+
     def _on_language_change(self, event, lang):
         """Handle language change"""
-        lang_buttons = js.document.querySelectorAll('.lang-btn')
-        for i in range(lang_buttons.length):
-            button = lang_buttons.item(i)
-            if button.getAttribute('data-lang') == lang:
-                button.classList.add('active')
-            else:
-                button.classList.remove('active')
+        self._sync_lang_buttons(lang)
         
         js.document.documentElement.lang = lang
         
-        translatable_elements = js.document.querySelectorAll('[data-' + lang + ']')
-        for i in range(translatable_elements.length):
-            element = translatable_elements.item(i)
-            element.textContent = element.getAttribute('data-' + lang)
+        for element, texts in self._translatable:
+            text = texts.get(lang)
+            if text is not None:
+                element.textContent = text
 
-        current_lang = js.document.documentElement.lang or "en"
+        names = self._names[lang if lang in _FIELDS else "en"]
         for city_id, marker in self.city_markers.items():
-            city_data = self.cities[city_id]
-            if city_data:
-                city_name = city_data.get("name_ru" if current_lang == "ru" else "name", "Unknown")
-
-                label_element = marker.querySelector('.city-marker-label')
-                if label_element:
-                    label_element.textContent = city_name
+            label_element = marker.querySelector('.city-marker-label')
+            if label_element:
+                label_element.textContent = names.get(city_id) or "Unknown"
         
         if self.selected_city_id:
             self._update_city_info()
@@ -403,6 +564,8 @@ class HomeView:
 
     def show(self):
         """Show this view"""
+        self._geom_cache = None
+        self._collect_translatable_elements()
         self.screen.classList.add("active")
 
     def hide(self):
@@ -411,16 +574,10 @@ class HomeView:
 
     def cleanup(self):
         """Clean up resources when the component is destroyed"""
-        if self.unsubscribe:
-            self.unsubscribe()
-
-        for handler_name, handler in self._handlers.items():
-            handler.destroy()
-
-        if hasattr(self, '_state_change_handler'):
-            self._state_change_handler.destroy()
-
-        if hasattr(self, '_resize_handler'):
-            js.window.removeEventListener("resize", self._resize_handler)
-            self._resize_handler.destroy()
+        self._release_subscription()
 
+        # Emptying the list makes a repeated cleanup a no-op; remove_event_listener
+        # raises for a listener that is no longer registered
+        listeners, self._listeners = self._listeners, []
+        for target, event_name, handler in listeners:
+            remove_event_listener(target, event_name, handler)
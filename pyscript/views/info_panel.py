@@ -11,6 +11,98 @@ from ..actions.geo_actions import GeoActions
 from ..utils.logging import log, error
 from ..utils.historical_periods import get_historical_period
 
+_CITY_SECTION_HTML = (
+    '<div class="info-section">'
+    '<h3></h3>'
+    '<p></p>'
+    '<div class="historical-period">'
+    '<h4 style="margin-top:15px;color:#2c3e50"></h4>'
+    '<p style="font-size:0.9em;line-height:1.5;color:#34495e"></p>'
+    '</div>'
+    '<p class="info-message" style="margin-top:15px;font-style:italic;color:#7f8c8d"></p>'
+    '</div>'
+)
+
+_OBJECT_SECTION_HTML = (
+    '<div class="info-section">'
+    '<h3></h3>'
+    '<p class="object-id"></p>'
+    '<p class="historical-context"></p>'
+    '<p class="object-role"><strong>Type:</strong> <span></span></p>'
+    '<div class="description-section"><h4>Description</h4></div>'
+    '<p class="time-period"><strong>Period:</strong> <span></span></p>'
+    '<div class="actions-section">'
+    '<button class="action-btn zoom-btn">Zoom to Feature</button>'
+    '<button class="action-btn export-btn">Export GeoJSON</button>'
+    '</div>'
+    '</div>'
+)
+
+_PROPERTIES_SECTION_HTML = (
+    '<div class="info-section additional-properties">'
+    '<h4>Additional Properties</h4>'
+    '<ul class="properties-list"></ul>'
+    '</div>'
+)
+
+_AGE_BANDS = (
+    (1, "This structure was just built in the current year ({year})."),
+    (10, "This is a relatively new structure, built {age} years ago in {start}."),
+    (50, "This structure has been standing for {age} years, since {start}."),
+    (100, "This is a well-established structure built {age} years ago in {start}."),
+    (float("inf"), "This is a historical structure that has stood for {age} years, since {start}."),
+)
+
+
+def _parse_year(value):
+    """Return a start/end date value as an int year, or None if it is not one"""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.strip().lstrip("-").isdigit():
+        return int(value)
+    return None
+
+
+_period_cache = {}
+
+
+def _period(year):
+    """Return get_historical_period(year), memoized per year"""
+    period = _period_cache.get(year)
+    if period is None:
+        period = _period_cache[year] = get_historical_period(year)
+    return period
+
+
+_LANG_BTN_CSS = (
+    ".lang-btn.active {"
+    "background-color:#2196F3 !important;"
+    "color:white !important;"
+    "border-color:#2196F3 !important"
+    "}"
+)
+
+
+def _install_lang_button_style():
+    """Add the active language button stylesheet to the document once"""
+    if js.document.getElementById("lang-btn-style"):
+        return
+    style = js.document.createElement("style")
+    style.id = "lang-btn-style"
+    style.textContent = _LANG_BTN_CSS
+    js.document.head.appendChild(style)
+
+
+_install_lang_button_style()
+
+
+def _create_template(html):
+    """Create a detached <template> element holding the given markup"""
+    template = js.document.createElement("template")
+    template.innerHTML = html
+    return template
+
+
 class InfoPanel:
     """Information panel component for displaying object details"""
 
@@ -29,6 +121,21 @@ class InfoPanel:
         self.store = AppStore()
         self.unsubscribe = None
         self._input_handlers = {}
+        self._lang_buttons = ()
+        self._last_sig = None
+        self._i18n_nodes = []
+        self._cities_index = {}
+        self._cities_ref = None
+        self._current_obj = None
+        self._years_props = None
+        self._years = (None, None)
+        self._zoom_proxy = create_proxy(lambda e: self.zoom_to_feature(self._current_obj))
+        self._export_proxy = create_proxy(lambda e: self.export_feature(self._current_obj))
+        self._lang = js.document.documentElement.lang or "en"
+
+        self._city_tpl = _create_template(_CITY_SECTION_HTML)
+        self._object_tpl = _create_template(_OBJECT_SECTION_HTML)
+        self._properties_tpl = _create_template(_PROPERTIES_SECTION_HTML)
 
     def initialize(self):
         """Initialize the component and subscribe to store updates"""
@@ -36,6 +143,7 @@ class InfoPanel:
             js.console.log(f"Warning: Panel elements not found in the DOM")
             return
 
+        self._lang = js.document.documentElement.lang or "en"
         self.unsubscribe = self.store.subscribe(create_proxy(self.on_state_change))
 
         from ..dispatch.dispatcher import Dispatcher
@@ -56,23 +164,17 @@ class InfoPanel:
             
             lang_switcher = js.document.createElement("div")
             lang_switcher.className = "language-switcher"
-            lang_switcher.style.position = "absolute"
-            lang_switcher.style.top = "10px"
-            lang_switcher.style.right = "10px"
+            lang_switcher.style.cssText = "position:absolute;top:10px;right:10px"
             
-            current_lang = js.document.documentElement.lang or "en"
+            current_lang = self._lang
             
             en_button = js.document.createElement("button")
             en_button.className = "lang-btn"
             if current_lang == "en":
                 en_button.classList.add("active")
-            en_button.setAttribute("data-lang", "en")
+            en_button.dataset.lang = "en"
             en_button.textContent = "EN"
-            en_button.style.padding = "5px 10px"
-            en_button.style.background = "#fff"
-            en_button.style.border = "1px solid #ddd"
-            en_button.style.borderRadius = "3px 0 0 3px"
-            en_button.style.cursor = "pointer"
+            en_button.style.cssText = "padding:5px 10px;background:#fff;border:1px solid #ddd;border-radius:3px 0 0 3px;cursor:pointer"
             self._input_handlers["lang_en"] = create_proxy(lambda e: self._on_language_change(e, "en"))
             en_button.onclick = self._input_handlers["lang_en"]
             
@@ -80,36 +182,17 @@ class InfoPanel:
             ru_button.className = "lang-btn"
             if current_lang == "ru":
                 ru_button.classList.add("active")
-            ru_button.setAttribute("data-lang", "ru")
+            ru_button.dataset.lang = "ru"
             ru_button.textContent = "RU"
-            ru_button.style.padding = "5px 10px"
-            ru_button.style.background = "#fff"
-            ru_button.style.border = "1px solid #ddd"
-            ru_button.style.borderLeft = "none"
-            ru_button.style.borderRadius = "0 3px 3px 0"
-            ru_button.style.cursor = "pointer"
+            ru_button.style.cssText = "padding:5px 10px;background:#fff;border:1px solid #ddd;border-left:none;border-radius:0 3px 3px 0;cursor:pointer"
             self._input_handlers["lang_ru"] = create_proxy(lambda e: self._on_language_change(e, "ru"))
             ru_button.onclick = self._input_handlers["lang_ru"]
             
             lang_switcher.appendChild(en_button)
             lang_switcher.appendChild(ru_button)
             
-            js.eval("""
-            if (!document.getElementById('lang-btn-style')) {
-                var style = document.createElement('style');
-                style.id = 'lang-btn-style';
-                style.textContent = `
-                    .lang-btn.active {
-                        background-color: #2196F3 !important;
-                        color: white !important;
-                        border-color: #2196F3 !important;
-                    }
-                `;
-                document.head.appendChild(style);
-            }
-            """)
-            
             self.panel.appendChild(lang_switcher)
+            self._lang_buttons = (("en", en_button), ("ru", ru_button))
             
 
             header.appendChild(controls)
@@ -140,47 +223,50 @@ class InfoPanel:
         if info_panel_open:
             self.render()
 
-        if self.panel:
-            self.panel.className = f"info-panel {'' if info_panel_open else 'collapsed'}"
-
-        if info_panel_open:
-            self.render()
-
-        if self.panel:
-            self.panel.className = f"info-panel {'' if info_panel_open else 'collapsed'}"
-
     def render(self):
         """Render the info panel content based on the current state"""
         if self.content is None:
             return
 
+        lang = js.document.documentElement.lang or "en"
+        if lang != self._lang:
+            # The home screen switched the language since the last render
+            self._lang = lang
+            for code, button in self._lang_buttons:
+                button.classList.toggle("active", code == lang)
+
         state = self.store.get_state()
         selected_object = state.get("selected_object")
         selected_city = None
         selected_year = None
 
+        cities = state.get("cities", [])
+        if cities is not self._cities_ref:
+            self._cities_index = {city["id"]: city for city in cities}
+            self._cities_ref = cities
+
         city_id = state.get("selected_city_id")
         if city_id:
-            for city in state.get("cities", []):
-                if city["id"] == city_id:
-                    selected_city = city
-                    break
+            selected_city = self._cities_index.get(city_id)
 
         selected_year = state.get("selected_year")
 
-        self.content.innerHTML = ""
-
-        if not selected_object:
-            if selected_city:
-                self.render_city_info(selected_city, selected_year)
-            else:
-                message = js.document.createElement("p")
-                message.className = "info-message"
-                message.textContent = "Please select a city to view information."
-                self.content.appendChild(message)
+        sig = (selected_object, city_id if selected_city else None, selected_year, self._lang)
+        if sig == self._last_sig:
             return
+        self._last_sig = sig
+        self._i18n_nodes = []
 
-        self.render_object_info(selected_object)
+        if selected_object:
+            content = self.render_object_info(selected_object)
+        elif selected_city:
+            content = self.render_city_info(selected_city, selected_year)
+        else:
+            content = js.document.createElement("p")
+            content.className = "info-message"
+            content.textContent = "Please select a city to view information."
+
+        self.content.replaceChildren(content)
 
     def render_city_info(self, city, year):
         """
@@ -189,51 +275,31 @@ class InfoPanel:
         Args:
             city: Selected city object
             year: Selected year
+            
+        Returns:
+            Detached fragment holding the city section
         """
-        from ..utils.historical_periods import get_historical_period
-        current_lang = js.document.documentElement.lang or "en"
-        is_russian = current_lang == "ru"
+        is_russian = self._lang == "ru"
 
-        city_section = js.document.createElement("div")
-        city_section.className = "info-section"
+        frag = self._city_tpl.content.cloneNode(True)
+        city_title, year_info, period_section, message = frag.firstElementChild.children
 
-        city_title = js.document.createElement("h3")
-        if is_russian:
-            city_title.textContent = city["name_ru"]
-        else:
-            city_title.textContent = city["name"]
-        city_section.appendChild(city_title)
+        i18n_nodes = [(city_title, city["name"], city["name_ru"])]
 
         if year:
-            year_info = js.document.createElement("p")
-            city_section.appendChild(year_info)
-            period = get_historical_period(year)
-            
-            period_section = js.document.createElement("div")
-            period_section.className = "historical-period"
-            period_title = js.document.createElement("h4")
-            period_title.style.marginTop = "15px"
-            period_title.style.color = "#2c3e50"
-            period_title.textContent = period["name_ru"] if is_russian else period["name"]
-            period_section.appendChild(period_title)
-            
-            period_desc = js.document.createElement("p")
-            period_desc.style.fontSize = "0.9em"
-            period_desc.style.lineHeight = "1.5"
-            period_desc.style.color = "#34495e"
-            period_desc.textContent = period["description_ru"] if is_russian else period["description"]
-            period_section.appendChild(period_desc)
-            
-            city_section.appendChild(period_section)
+            period = _period(year)
+            period_title, period_desc = period_section.children
+            i18n_nodes.append((period_title, period["name"], period["name_ru"]))
+            i18n_nodes.append((period_desc, period["description"], period["description_ru"]))
+        else:
+            year_info.remove()
+            period_section.remove()
 
-        message = js.document.createElement("p")
-        message.className = "info-message"
-        message.style.marginTop = "15px"
-        message.style.fontStyle = "italic"
-        message.style.color = "#7f8c8d"
-        city_section.appendChild(message)
+        for node, text_en, text_ru in i18n_nodes:
+            node.textContent = text_ru if is_russian else text_en
 
-        self.content.appendChild(city_section)
+        self._i18n_nodes = i18n_nodes
+        return frag
 
     def render_object_info(self, obj):
         """
@@ -241,145 +307,135 @@ class InfoPanel:
         
         Args:
             obj: Selected GeoJSON Feature
+            
+        Returns:
+            Detached node holding the object details, or an error message
         """
+        doc = js.document
+        create = doc.createElement
         try:
             props = obj.get("properties", {})
             
             state = self.store.get_state()
             current_year = state.get("selected_year")
             
-            obj_section = js.document.createElement("div")
-            obj_section.className = "info-section"
+            frag = self._object_tpl.content.cloneNode(True)
+            obj_section = frag.firstElementChild
+            title, id_info, context, role_info, desc_section, period_info, actions_section = obj_section.children
 
-            name = props.get("name", "Unnamed Object")
-            title = js.document.createElement("h3")
-            title.textContent = name
-            obj_section.appendChild(title)
+            title.textContent = props.get("name", "Unnamed Object")
 
             if "id" in props:
-                id_info = js.document.createElement("p")
-                id_info.className = "object-id"
                 id_info.textContent = f"ID: {props['id']}"
-                obj_section.appendChild(id_info)
+            else:
+                id_info.remove()
 
             start_date = props.get("start_date")
-            end_date = props.get("end_date")
+            has_context = False
             
             if start_date and current_year:
-                try:
-                    start_year = int(start_date) if isinstance(start_date, (int, str)) else None
-                    end_year = int(end_date) if isinstance(end_date, (int, str)) and end_date != "Present" else None
+                start_year, end_year = self._object_years(props)
+
+                if start_year and start_year <= current_year and (not end_year or current_year <= end_year):
+                    age = current_year - start_year
+                    
+                    for threshold, template in _AGE_BANDS:
+                        if age < threshold:
+                            context.textContent = template.format(age=age, year=current_year, start=start_year)
+                            break
                     
-                    if start_year and start_year <= current_year and (not end_year or current_year <= end_year):
-                        age = current_year - start_year
-                        context = js.document.createElement("p")
-                        context.className = "historical-context"
-                        
-                        if age == 0:
-                            context.textContent = f"This structure was just built in the current year ({current_year})."
-                        elif age < 10:
-                            context.textContent = f"This is a relatively new structure, built {age} years ago in {start_year}."
-                        elif age < 50:
-                            context.textContent = f"This structure has been standing for {age} years, since {start_year}."
-                        elif age < 100:
-                            context.textContent = f"This is a well-established structure built {age} years ago in {start_year}."
-                        else:
-                            context.textContent = f"This is a historical structure that has stood for {age} years, since {start_year}."
-                        
-                        context.style.fontStyle = "italic"
-                        context.style.color = "#7f8c8d"
-                        context.style.marginTop = "10px"
-                        obj_section.appendChild(context)
-                    elif start_year and start_year > current_year:
-                        future = js.document.createElement("p")
-                        future.className = "historical-context future"
-                        future.textContent = f"Note: This structure will be built {start_year - current_year} years in the future ({start_year})."
-                        future.style.color = "#e74c3c"
-                        future.style.fontStyle = "italic"
-                        obj_section.appendChild(future)
-                    elif end_year and current_year > end_year:
-                        past = js.document.createElement("p")
-                        past.className = "historical-context past"
-                        past.textContent = f"Note: This structure no longer exists in {current_year}. It was demolished or replaced in {end_year}."
-                        past.style.color = "#e74c3c"
-                        past.style.fontStyle = "italic"
-                        obj_section.appendChild(past)
-                except (ValueError, TypeError):
-                    pass
+                    context.style.cssText = "font-style:italic;color:#7f8c8d;margin-top:10px"
+                    has_context = True
+                elif start_year and start_year > current_year:
+                    context.className = "historical-context future"
+                    context.textContent = f"Note: This structure will be built {start_year - current_year} years in the future ({start_year})."
+                    context.style.cssText = "color:#e74c3c;font-style:italic"
+                    has_context = True
+                elif start_year and end_year and current_year > end_year:
+                    context.className = "historical-context past"
+                    context.textContent = f"Note: This structure no longer exists in {current_year}. It was demolished or replaced in {end_year}."
+                    context.style.cssText = "color:#e74c3c;font-style:italic"
+                    has_context = True
+
+            if not has_context:
+                context.remove()
 
             if "role" in props:
-                role_info = js.document.createElement("p")
-                role_info.className = "object-role"
-                role_info.innerHTML = f"<strong>Type:</strong> {props['role']}"
-                obj_section.appendChild(role_info)
-
-            if "description" in props and props["description"]:
-                desc_section = js.document.createElement("div")
-                desc_section.className = "description-section"
-
-                desc_header = js.document.createElement("h4")
-                desc_header.textContent = "Description"
-                desc_section.appendChild(desc_header)
-
-                desc_content = js.document.createElement("p")
-
-                try:
-                    desc_json = json.loads(props["description"])
-                    desc_list = js.document.createElement("ul")
+                role_info.lastElementChild.textContent = props["role"]
+            else:
+                role_info.remove()
+
+            description = props.get("description")
+            if description:
+                desc_json = None
+                if isinstance(description, str) and description.lstrip()[:1] == "{":
+                    try:
+                        desc_json = json.loads(description)
+                    except (ValueError, TypeError):
+                        pass
+
+                if isinstance(desc_json, dict):
+                    desc_list = create("ul")
                     desc_list.className = "properties-list"
 
                     for key, value in desc_json.items():
-                        list_item = js.document.createElement("li")
-                        list_item.innerHTML = f"<strong>{key}</strong>: {value}"
+                        list_item = create("li")
+                        strong = create("strong")
+                        strong.textContent = key
+                        list_item.appendChild(strong)
+                        list_item.appendChild(doc.createTextNode(f": {value}"))
                         desc_list.appendChild(list_item)
 
                     desc_section.appendChild(desc_list)
-                except:
-                    desc_content.textContent = props["description"]
+                else:
+                    desc_content = create("p")
+                    desc_content.textContent = description
                     desc_section.appendChild(desc_content)
-
-                obj_section.appendChild(desc_section)
+            else:
+                desc_section.remove()
 
             if "start_date" in props or "end_date" in props:
-                period_info = js.document.createElement("p")
-                period_info.className = "time-period"
-
-                start_date = props.get("start_date", "Unknown")
-                end_date = props.get("end_date", "Present")
-
-                period_info.innerHTML = f"<strong>Period:</strong> {start_date} to {end_date}"
-                obj_section.appendChild(period_info)
-
-            actions_section = js.document.createElement("div")
-            actions_section.className = "actions-section"
-
-            zoom_btn = js.document.createElement("button")
-            zoom_btn.className = "action-btn zoom-btn"
-            zoom_btn.textContent = "Zoom to Feature"
-            zoom_btn.onclick = create_proxy(lambda e: self.zoom_to_feature(obj))
-            actions_section.appendChild(zoom_btn)
-
-            export_btn = js.document.createElement("button")
-            export_btn.className = "action-btn export-btn"
-            export_btn.textContent = "Export GeoJSON"
-            export_btn.onclick = create_proxy(lambda e: self.export_feature(obj))
-            actions_section.appendChild(export_btn)
-
-            obj_section.appendChild(actions_section)
+                period_info.lastElementChild.textContent = f"{props.get('start_date', 'Unknown')} to {props.get('end_date', 'Present')}"
+            else:
+                period_info.remove()
 
-            self.content.appendChild(obj_section)
+            self._current_obj = obj
+            zoom_btn, export_btn = actions_section.children
+            zoom_btn.onclick = self._zoom_proxy
+            export_btn.onclick = self._export_proxy
 
             additional_props = {k: v for k, v in props.items()
                                 if k not in ['id', 'name', 'role', 'description', 'start_date', 'end_date']}
 
             if additional_props:
-                self.render_additional_properties(additional_props)
+                frag.appendChild(self.render_additional_properties(additional_props))
+
+            return frag
 
         except Exception as e:
-            error_msg = js.document.createElement("p")
+            error_msg = create("p")
             error_msg.className = "error-message"
             error_msg.textContent = f"Error displaying object information: {str(e)}"
-            self.content.appendChild(error_msg)
+            return error_msg
+
+    def _object_years(self, props):
+        """
+        Get the parsed start and end years of an object, reusing the last result
+        
+        Args:
+            props: Properties dictionary of the object
+            
+        Returns:
+            Tuple of (start_year, end_year), either of which may be None
+        """
+        if props is not self._years_props:
+            end_date = props.get("end_date")
+            self._years = (
+                _parse_year(props.get("start_date")),
+                None if end_date == "Present" else _parse_year(end_date),
+            )
+            self._years_props = props
+        return self._years
 
     def render_additional_properties(self, props):
         """
@@ -387,25 +443,25 @@ class InfoPanel:
         
         Args:
             props: Dictionary of additional properties
+            
+        Returns:
+            Detached fragment holding the properties section
         """
-        add_section = js.document.createElement("div")
-        add_section.className = "info-section additional-properties"
-
-        header = js.document.createElement("h4")
-        header.textContent = "Additional Properties"
-        add_section.appendChild(header)
-
-        props_list = js.document.createElement("ul")
-        props_list.className = "properties-list"
+        frag = self._properties_tpl.content.cloneNode(True)
+        props_list = frag.firstElementChild.lastElementChild
+        doc = js.document
+        create = doc.createElement
+        text = doc.createTextNode
 
         for key, value in props.items():
-            item = js.document.createElement("li")
-            item.innerHTML = f"<strong>{key}</strong>: {value}"
+            item = create("li")
+            strong = create("strong")
+            strong.textContent = key
+            item.appendChild(strong)
+            item.appendChild(text(f": {value}"))
             props_list.appendChild(item)
 
-        add_section.appendChild(props_list)
-
-        self.content.appendChild(add_section)
+        return frag
 
     def zoom_to_feature(self, feature):
         """
@@ -424,7 +480,7 @@ class InfoPanel:
             feature: GeoJSON Feature to export
         """
         try:
-            feature_json = json.dumps(feature, indent=2)
+            feature_json = json.dumps(feature, separators=(",", ":"))
 
             blob = js.Blob.new([feature_json], {"type": "application/json"})
 
@@ -435,10 +491,7 @@ class InfoPanel:
             link = js.document.createElement("a")
             link.href = url
             link.download = f"{name}_geojson.json"
-
-            js.document.body.appendChild(link)
             link.click()
-            js.document.body.removeChild(link)
 
             js.URL.revokeObjectURL(url)
 
@@ -450,6 +503,12 @@ class InfoPanel:
         if self.unsubscribe:
             self.unsubscribe()
 
+        self._current_obj = None
+        self._years_props = None
+        self._years = (None, None)
+        self._zoom_proxy.destroy()
+        self._export_proxy.destroy()
+
     def _on_language_change(self, event, lang):
         """
         Handle language change
@@ -462,25 +521,17 @@ class InfoPanel:
             event.stopPropagation()
         
         if lang:
-            lang_buttons = js.document.querySelectorAll('.lang-btn')
-            for i in range(lang_buttons.length):
-                button = lang_buttons.item(i)
-                button_lang = button.getAttribute('data-lang')
-                if button_lang == lang:
-                    if not button.classList.contains('active'):
-                        button.classList.add('active')
-                else:
-                    if button.classList.contains('active'):
-                        button.classList.remove('active')
+            doc = js.document
+            for code, button in self._lang_buttons:
+                button.classList.toggle("active", code == lang)
         
-            js.document.documentElement.lang = lang
+            doc.documentElement.lang = lang
+            self._lang = lang
             
-            translatable_elements = js.document.querySelectorAll(f'[data-{lang}]')
-            for i in range(translatable_elements.length):
-                element = translatable_elements.item(i)
-                element.textContent = element.getAttribute(f'data-{lang}')
-
-            title_elem = js.document.querySelector(f"#{self.panel_id} > h2")
-            if title_elem and title_elem.hasAttribute(f"data-{lang}"):
-                title_elem.textContent = title_elem.getAttribute(f"data-{lang}")
-            self.render()
+            for element in doc.querySelectorAll(f'[data-{lang}]'):
+                element.textContent = getattr(element.dataset, lang)
+
+            for node, text_en, text_ru in self._i18n_nodes:
+                node.textContent = text_ru if lang == "ru" else text_en
+            if self._last_sig:
+                self._last_sig = self._last_sig[:-1] + (lang,)
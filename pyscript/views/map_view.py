@@ -1,19 +1,230 @@
 """
 Map view component for displaying geographic data using Leaflet
 """
+import functools
 import js
 import json
-from pyodide.ffi import create_proxy
+import math
+from pyodide.ffi import create_proxy, to_js
 from ..store.app_store import AppStore
 from ..actions.geo_actions import GeoActions
 from ..actions.city_actions import CityActions
+from ..dispatch.dispatcher import Dispatcher
 from ..config import MAP_DEFAULT_CENTER, MAP_DEFAULT_ZOOM
 from ..utils.logging import *
 
+# Bound once: every js.<name> access crosses the Pyodide proxy boundary
+_L = js.L
+_window = js.window
+_document = js.document
+
+_VIEW_COMMIT_DELAY_MS = 120
+
+# Map events handled by MapView._on_map_event, in Leaflet's space-separated form
+_MAP_EVENTS = "click zoomend moveend"
+
+# Screen distance below which a stored map center counts as the current one
+_VIEW_PIXEL_TOLERANCE = 2
+
+# Features added to the map per idle callback; the first batch is added at once
+_FEATURE_CHUNK_SIZE = 500
+
+_HAS_IDLE_CALLBACK = hasattr(_window, "requestIdleCallback")
+
+_from_entries = js.Object.fromEntries
+
+_DEFAULT_COLOR = "#3388ff"
+
+_ROLE_COLORS = {
+    "highway:residential": "#e6194b",
+    "way": "#3cb44b",
+    "landuse:residential": "#ffe119",
+    "highway:unclassified": "#ff7f00",
+    "building:yes": "#f58231",
+    "highway:primary": "#911eb4",
+    "railway:rail": "#000000",
+    "building:apartments": "#42d4f4",
+    "building:house": "#fabebe",
+    "highway:tertiary": "#469990",
+    "highway:footway": "#9a6324",
+    "waterway:river": "#0000ff",
+    "highway:service": "#800000",
+    "highway:secondary": "#e6beff",
+    "highway:trunk": "#f032e6",
+    "building:church": "#808000",
+    "natural:water": "#000080",
+    "highway:pedestrian": "#ffe119",
+    "railway:subway": "#aaffc3",
+    "building:school": "#4ed364",
+    "waterway:dock": "#3e82fc",
+    "landuse:grass": "#00ff00",
+}
+
+_PREFIX_COLORS = (
+    ("highway:", "#e6194b"),
+    ("building:", "#f58231"),
+    ("waterway:", "#0000ff"),
+    ("railway:", "#000000"),
+    ("landuse:", "#3cb44b"),
+    ("natural:", "#4363d8"),
+    ("amenity:", "#ffe119"),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_role_color(role):
+    """Return the display colour for a role: exact match, then prefix match, then the default"""
+    if not role:
+        return _DEFAULT_COLOR
+    color = _ROLE_COLORS.get(role)
+    if color:
+        return color
+    for prefix, color in _PREFIX_COLORS:
+        if role.startswith(prefix):
+            return color
+    return _DEFAULT_COLOR
+
+
+def _install_attribution_style():
+    """Add the stylesheet hiding Leaflet's attribution flag to the document once"""
+    if _document.getElementById("leaflet-attribution-style"):
+        return
+    style = _document.createElement("style")
+    style.id = "leaflet-attribution-style"
+    style.textContent = ".leaflet-attribution-flag{display:none !important}"
+    _document.head.appendChild(style)
+
+
+_install_attribution_style()
+
+_COLORIZE_RUNTIME_JS = """
+    window.roleColors = {};
+    window.roleStyles = {};
+    window.defaultStyle = {color: "#3388ff", weight: 2, opacity: 0.7, fillOpacity: 0.2};
+    
+    window.setRoleColors = function(table) {
+        window.roleColors = table;
+        window.roleStyles = {};
+    };
+    
+    window.getColor = function(role) {
+        return window.roleColors[role] || "#3388ff";
+    };
+    
+    window.styleByRole = function(feature) {
+        var role = feature.properties && feature.properties.role;
+        if (!role) {
+            return window.defaultStyle;
+        }
+        
+        var geometryType = feature.geometry ? feature.geometry.type : '';
+        var isLine = geometryType === 'LineString' || geometryType === 'MultiLineString';
+        var key = (isLine ? "line|" : "area|") + role;
+        var style = window.roleStyles[key];
+        if (style) {
+            return style;
+        }
+        
+        var color = window.getColor(role);
+        style = {
+            color: color,
+            weight: 2,
+            opacity: 0.7,
+            fill: !isLine,
+            fillColor: color,
+            fillOpacity: isLine ? 0 : 0.2
+        };
+        window.roleStyles[key] = style;
+        return style;
+    };
+    
+    window.addFeatureLayer = function(group, feature) {
+        var options = group.options;
+        var onEachFeature = options.onEachFeature;
+        var added = null;
+        options.onEachFeature = function(f, layer) {
+            added = layer;
+            if (onEachFeature) onEachFeature(f, layer);
+        };
+        try {
+            group.addData(feature);
+        } finally {
+            options.onEachFeature = onEachFeature;
+        }
+        return added;
+    };
+"""
+
+
+def _feature_key(feature):
+    """Return a stable key for a GeoJSON feature: its id, its properties id, or its identity"""
+    key = feature.get("id")
+    if key is None:
+        key = (feature.get("properties") or {}).get("id")
+    return key if key is not None else id(feature)
+
+
+def _leaflet_feature(feature):
+    """Return a copy of a feature carrying only the properties the map layer reads"""
+    properties = feature.get("properties") or {}
+    slim = {
+        "type": "Feature",
+        "geometry": feature.get("geometry"),
+        "properties": {"role": properties.get("role", ""), "name": properties.get("name")},
+    }
+    if "id" in properties:
+        # Kept so _feature_key gives the same key for the slim copy
+        slim["properties"]["id"] = properties["id"]
+    if "id" in feature:
+        slim["id"] = feature["id"]
+    return slim
+
+
+def _feature_bbox(feature):
+    """
+    Compute the bounding box of a GeoJSON feature
+
+    Args:
+        feature: GeoJSON Feature dictionary
+
+    Returns:
+        (west, south, east, north) tuple, or None if the feature has no coordinates
+    """
+    geometry = feature.get("geometry") or {}
+    if geometry.get("type") == "GeometryCollection":
+        stack = [g.get("coordinates") for g in geometry.get("geometries", [])]
+    else:
+        stack = [geometry.get("coordinates")]
+
+    west = south = math.inf
+    east = north = -math.inf
+    while stack:
+        coords = stack.pop()
+        if not coords:
+            continue
+        if isinstance(coords[0], (int, float)):
+            lng, lat = coords[0], coords[1]
+            if lng < west:
+                west = lng
+            if lng > east:
+                east = lng
+            if lat < south:
+                south = lat
+            if lat > north:
+                north = lat
+        else:
+            stack.extend(coords)
+
+    if west > east:
+        return None
+    return west, south, east, north
+
 
 class MapView:
     """Map view component for displaying geographic data"""
 
+    _runtime_installed = False
+
     def __init__(self, container_id="map-container"):
         """
         Initialize the map view
@@ -22,15 +233,37 @@ class MapView:
             container_id: ID of the HTML container element
         """
         self.container_id = container_id
-        self.container = js.document.getElementById(container_id)
+        self.container = _document.getElementById(container_id)
         self.store = AppStore()
         self.unsubscribe = None
+        self._state_change_handler = None
         self.map = None
         self.layers = {}
         self.popup = None
         self.selected_layer = None
-        self._proxy_handlers = {}
+        self._map_event_proxy = None
+        self._feature_click_proxy = None
+        self._commit_view_proxy = None
+        self._move_timer = None
+        self._flush_renders_proxy = None
+        self._render_frame = None
+        self._pending_renders = {}
+        self._last_geo_objects = None
+        self._last_selected_object = None
+        self._geo_source = None
+        self._geo_bboxes = []
+        self._feature_layers = {}
+        self._features_by_layer = {}
+        self._pending_features = []
+        self._add_chunk_proxy = None
+        self._chunk_handle = None
+        self._fit_after_fill = False
+        self._filled_bounds = None
         self._updating_map = False
+        self._geo_options = None
+        self._highlight_options = None
+        self._renderer = None
+        self._tile_layer = None
 
     def initialize(self):
         """Initialize the component, create the map and subscribe to store updates"""
@@ -40,40 +273,100 @@ class MapView:
 
         self.create_map()
 
-        self._state_change_handler = create_proxy(self.on_state_change)
-        self.unsubscribe = self.store.subscribe(self._state_change_handler)
+        if self._state_change_handler is None:
+            self._state_change_handler = create_proxy(self.on_state_change)
+            self.unsubscribe = self.store.subscribe(self._state_change_handler)
 
     def _clear_event_handlers(self):
         """Clear all event handlers and destroy proxies"""
         if not self.map:
             return
 
-        for event_name, handler in self._proxy_handlers.items():
+        if self._map_event_proxy:
             try:
-                self.map.off(event_name, handler)
-                handler.destroy()
+                self.map.off(_MAP_EVENTS, self._map_event_proxy)
+                self._map_event_proxy.destroy()
             except Exception as e:
-                error(f"Error removing {event_name} handler: {e}")
+                error(f"Error removing map event handler: {e}")
+            self._map_event_proxy = None
 
-        if hasattr(self, 'style_function_proxy') and self.style_function_proxy:
+        if self._feature_click_proxy:
             try:
-                self.style_function_proxy.destroy()
-                self.style_function_proxy = None
+                self.layers['main'].off("click", self._feature_click_proxy)
+                self._feature_click_proxy.destroy()
             except Exception as e:
-                error(f"Error destroying style function proxy: {e}")
+                error(f"Error removing feature click handler: {e}")
+            self._feature_click_proxy = None
+
+        if self._move_timer is not None:
+            js.clearTimeout(self._move_timer)
+            self._move_timer = None
+
+        if self._commit_view_proxy:
+            self._commit_view_proxy.destroy()
+            self._commit_view_proxy = None
+
+        if self._render_frame is not None:
+            js.cancelAnimationFrame(self._render_frame)
+            self._render_frame = None
+        self._pending_renders = {}
+
+        if self._flush_renders_proxy:
+            self._flush_renders_proxy.destroy()
+            self._flush_renders_proxy = None
+
+        self._cancel_feature_chunk()
+        self._pending_features = []
 
-        self._proxy_handlers = {}
+        if self._add_chunk_proxy:
+            self._add_chunk_proxy.destroy()
+            self._add_chunk_proxy = None
 
     def _setup_event_handlers(self):
         """Set up event handlers for the map with proper proxy management"""
 
-        self._proxy_handlers['click'] = create_proxy(self.on_map_click)
-        self._proxy_handlers['zoomend'] = create_proxy(self.on_map_zoom)
-        self._proxy_handlers['moveend'] = create_proxy(self.on_map_move)
+        self._map_event_proxy = create_proxy(self._on_map_event)
+        self.map.on(_MAP_EVENTS, self._map_event_proxy)
 
-        self.map.on("click", self._proxy_handlers['click'])
-        self.map.on("zoomend", self._proxy_handlers['zoomend'])
-        self.map.on("moveend", self._proxy_handlers['moveend'])
+        self._feature_click_proxy = create_proxy(self._on_feature_click)
+        self.layers['main'].on("click", self._feature_click_proxy)
+
+        self._commit_view_proxy = create_proxy(self._commit_view)
+        self._flush_renders_proxy = create_proxy(self._flush_renders)
+        self._add_chunk_proxy = create_proxy(self._add_feature_chunk)
+
+    def _install_colorize_runtime(self):
+        """Define the role colouring helpers on window, once per page"""
+        if MapView._runtime_installed:
+            return
+        js.eval(_COLORIZE_RUNTIME_JS)
+        MapView._runtime_installed = True
+
+    @staticmethod
+    def _build_role_color_table(features):
+        """
+        Resolve the colour of every role present in a feature list
+
+        Args:
+            features: List of GeoJSON Feature dictionaries
+
+        Returns:
+            Dictionary mapping each distinct role to its final colour
+        """
+        roles = {(feature.get("properties") or {}).get("role") for feature in features}
+        return {role: _resolve_role_color(role) for role in roles if role}
+
+    def _get_color_for_role(self, role):
+        """
+        Get the display colour for an object role
+
+        Args:
+            role: Object role string, e.g. "highway:primary"
+
+        Returns:
+            CSS colour string
+        """
+        return _resolve_role_color(role)
 
     def create_map(self):
         """Create the Leaflet map instance"""
@@ -82,15 +375,6 @@ class MapView:
                 error(f"Error: Map container '{self.container_id}' not found in DOM")
                 return
 
-            if self.map:
-                log("Removing existing map instance")
-                self._clear_event_handlers()
-                try:
-                    self.map.remove()
-                except Exception as e:
-                    error(f"Error removing old map: {e}")
-                self.map = None
-
             if not MAP_DEFAULT_CENTER or len(MAP_DEFAULT_CENTER) != 2:
                 center = [51.5074, -0.1278]
                 log(f"Using default center: {center}")
@@ -98,25 +382,51 @@ class MapView:
                 center = MAP_DEFAULT_CENTER
                 log(f"Using configured center: {center}")
 
-            center_obj = js.L.latLng(center[0], center[1])
+            center_obj = _L.latLng(center[0], center[1])
 
             zoom = MAP_DEFAULT_ZOOM if isinstance(MAP_DEFAULT_ZOOM, int) else 13
 
-            log(f"Creating map with center: {center}, zoom: {zoom}")
-            self.map = js.L.map(self.container_id).setView(center_obj, zoom)
+            if self.map:
+                log("Reusing existing map instance")
+                if self._move_timer is not None:
+                    js.clearTimeout(self._move_timer)
+                    self._move_timer = None
+                # The reset is not a user move; its moveend must not push the
+                # default center into the store
+                self._updating_map = True
+                try:
+                    self.map.setView(center_obj, zoom, to_js({"animate": False}, dict_converter=_from_entries))
+                finally:
+                    self._updating_map = False
+                self.reset_data()
+                return
 
-            js.L.tileLayer('https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png', {
+            log(f"Creating map with center: {center}, zoom: {zoom}")
+            self.map = _L.map(self.container_id).setView(center_obj, zoom)
+            self._install_colorize_runtime()
+
+            self._renderer = _L.canvas(to_js({"padding": 0.5}, dict_converter=_from_entries))
+            self._geo_options = to_js({
+                "style": _window.styleByRole,
+                "renderer": self._renderer
+            }, dict_converter=_from_entries)
+            self._highlight_options = to_js({
+                "style": {"color": "#ff0000", "weight": 4, "opacity": 1, "fillOpacity": 0.5}
+            }, dict_converter=_from_entries)
+
+            self.layers['main'] = _L.geoJSON(None, self._geo_options)
+            self.layers['main'].addTo(self.map)
+            self._feature_layers = {}
+            self._features_by_layer = {}
+            self._pending_features = []
+            self._last_geo_objects = None
+            self._last_selected_object = None
+
+            self._tile_layer = _L.tileLayer('https://tile.openstreetmap.org/{z}/{x}/{y}.png', {
                 "attribution": '&copy; <a href="https://www.openstreetmap.org/copyright">OpenStreetMap</a> contributors',
                 "maxZoom": 19
-            }).addTo(self.map)
-
-            js.eval("""
-            (function() {
-                var style = document.createElement('style');
-                style.textContent = '.leaflet-attribution-flag { display: none !important; }';
-                document.head.appendChild(style);
-            })();
-            """)
+            })
+            self._tile_layer.addTo(self.map)
 
             self._setup_event_handlers()
 
@@ -127,6 +437,24 @@ class MapView:
             error(f"Error creating map: {str(e)}")
             log(traceback.format_exc())
 
+    def reset_data(self):
+        """Empty the data layers of an existing map and redraw them from the store"""
+        self._cancel_feature_chunk()
+        self._pending_features = []
+        self._pending_renders = {}
+        self.clear_selection()
+        self.layers['main'].clearLayers()
+        self._feature_layers = {}
+        self._features_by_layer = {}
+        self._geo_source = None
+        self._geo_bboxes = []
+        self._filled_bounds = None
+        self._last_geo_objects = None
+        self._last_selected_object = None
+
+        # Renders dropped above are rebuilt from the store, together with its view
+        self.on_state_change(self.store.get_state())
+
     def cleanup(self):
         """Clean up resources when the component is destroyed"""
         log("Cleaning up MapView resources")
@@ -138,14 +466,23 @@ class MapView:
             except Exception as e:
                 error(f"Error during unsubscribe: {e}")
 
-        if hasattr(self, '_state_change_handler'):
+        if self._state_change_handler is not None:
             try:
                 self._state_change_handler.destroy()
             except Exception as e:
                 error(f"Error destroying state change handler: {e}")
+            self._state_change_handler = None
 
         self._clear_event_handlers()
 
+        self._geo_options = None
+        self._highlight_options = None
+        self._renderer = None
+        self._tile_layer = None
+        self.layers = {}
+        self._feature_layers = {}
+        self._features_by_layer = {}
+
         if self.map:
             try:
                 self.map.remove()
@@ -166,27 +503,22 @@ class MapView:
 
         geo_objects = state.get("geo_objects")
 
-        if geo_objects and self.map:
+        if geo_objects and self.map and geo_objects is not self._last_geo_objects:
+            self._last_geo_objects = geo_objects
 
             log(f"load {len(geo_objects)} geo_objects")
-            current_zoom = self.map.getZoom()
-
-            self._updating_map = True
-            try:
-                self.update_geo_layers(geo_objects.get('data', geo_objects), preserve_zoom=True)
-            finally:
-                self._updating_map = False
+            data = geo_objects.get('data', geo_objects)
+            self._schedule_render("geo", lambda: self.update_geo_layers(data, preserve_zoom=True))
 
         selected_object = state.get("selected_object")
 
         if selected_object and self.map:
-            self._updating_map = True
-            try:
-                self.highlight_selected_object(selected_object, preserve_zoom=True)
-            finally:
-                self._updating_map = False
-        elif selected_object is None and self.selected_layer:
-            self.clear_selection()
+            if selected_object is not self._last_selected_object:
+                self._last_selected_object = selected_object
+                self._schedule_render("highlight", lambda: self.highlight_selected_object(selected_object, preserve_zoom=True))
+        elif selected_object is None and (self.selected_layer or "highlight" in self._pending_renders):
+            self._last_selected_object = None
+            self._schedule_render("highlight", self.clear_selection)
 
 
         map_center = state.get("map_center")
@@ -196,337 +528,282 @@ class MapView:
             current_center = self.map.getCenter()
             current_zoom = self.map.getZoom()
 
+            zoom_changed = map_zoom is not None and current_zoom != map_zoom
             try:
-                center_lat_changed = abs(current_center.lat - map_center[0]) > 0.0001
-                center_lng_changed = abs(current_center.lng - map_center[1]) > 0.0001
-                zoom_changed = map_zoom is not None and current_zoom != map_zoom
+                # Centers that land within a couple of screen pixels of each
+                # other are the same view; moving would only echo a moveend.
+                proposed = self.map.latLngToContainerPoint(_L.latLng(map_center[0], map_center[1]))
+                current = self.map.latLngToContainerPoint(current_center)
+                center_changed = (abs(proposed.x - current.x) >= _VIEW_PIXEL_TOLERANCE
+                                  or abs(proposed.y - current.y) >= _VIEW_PIXEL_TOLERANCE)
             except Exception as e:
                 error(f"Error comparing map coordinates: {e}")
-                center_lat_changed = True
-                center_lng_changed = True
-                zoom_changed = map_zoom is not None
+                center_changed = (abs(current_center.lat - map_center[0]) > 0.0001
+                                  or abs(current_center.lng - map_center[1]) > 0.0001)
 
-            if center_lat_changed or center_lng_changed or zoom_changed:
+            if center_changed or zoom_changed:
                 self._updating_map = True
                 try:
-                    new_zoom = map_zoom if map_zoom is not None else current_zoom
-                    self.map.setView([map_center[0], map_center[1]], new_zoom)
-                    log(f"Updated map view to center: {map_center}, zoom: {new_zoom}")
+                    if center_changed and zoom_changed:
+                        self.map.setView([map_center[0], map_center[1]], map_zoom)
+                    elif zoom_changed:
+                        self.map.setZoom(map_zoom)
+                    else:
+                        self.map.panTo([map_center[0], map_center[1]])
+                    log(f"Updated map view to center: {map_center}, zoom: {map_zoom if zoom_changed else current_zoom}")
                 except Exception as e:
                     error(f"Error updating map view: {e}")
                 finally:
                     self._updating_map = False
 
-    def update_geo_layers(self, geo_objects, preserve_zoom=False):
+                # A non-animated view change fires moveend while the guard is
+                # set, so the viewport filter has to be refreshed from here
+                self._refill_if_view_left_bounds()
+
+    def _schedule_render(self, key, render):
+        """
+        Queue a map mutation to run in the next animation frame
+
+        Args:
+            key: Slot name ("geo" or "highlight"); a later call replaces a pending one
+            render: Callable performing the mutation
+        """
+        self._pending_renders[key] = render
+        if self._render_frame is None:
+            self._render_frame = js.requestAnimationFrame(self._flush_renders_proxy)
+
+    def _flush_renders(self, timestamp):
+        """Run the queued map mutations, geo data before the selection highlight"""
+        self._render_frame = None
+        pending, self._pending_renders = self._pending_renders, {}
+        if not self.map:
+            return
+
+        self._updating_map = True
         try:
-            current_zoom = None
-            current_center = None
-            if preserve_zoom and self.map:
-                current_zoom = self.map.getZoom()
-                current_center = self.map.getCenter()
+            for key in ("geo", "highlight"):
+                render = pending.get(key)
+                if render:
+                    render()
+        finally:
+            self._updating_map = False
 
-            if 'main' in self.layers and self.layers['main']:
-                try:
-                    self.map.removeLayer(self.layers['main'])
-                except Exception as e:
-                    log(f"Error removing existing layer: {e}")
-                self.layers['main'] = None
-
-            js.eval("""
-            window.roleColors = {
-                "highway:residential": "#e6194b",
-                "way": "#3cb44b",
-                "landuse:residential": "#ffe119",
-                "highway:unclassified": "#ff7f00",
-                "building:yes": "#f58231",
-                "highway:primary": "#911eb4",
-                "railway:rail": "#000000",
-                "building:apartments": "#42d4f4",
-                "building:house": "#fabebe",
-                "highway:tertiary": "#469990",
-                "highway:footway": "#9a6324",
-                "waterway:river": "#0000ff",
-                "highway:service": "#800000",
-                "highway:secondary": "#e6beff",
-                "highway:trunk": "#f032e6",
-                "building:church": "#808000",
-                "natural:water": "#000080",
-                "highway:pedestrian": "#ffe119",
-                "railway:subway": "#aaffc3",
-                "building:school": "#4ed364",
-                "waterway:dock": "#3e82fc",
-                "landuse:grass": "#00ff00"
-            };
-            
-            window.prefixColors = {
-                "highway:": "#e6194b",
-                "building:": "#f58231",
-                "waterway:": "#0000ff",
-                "railway:": "#000000",
-                "landuse:": "#3cb44b",
-                "natural:": "#4363d8",
-                "amenity:": "#ffe119"
-            };
-            
-            window.getColor = function(role) {
-                if (!role) return "#3388ff";
-                
-                if (window.roleColors[role]) {
-                    return window.roleColors[role];
-                }
-                
-                for (var prefix in window.prefixColors) {
-                    if (role.startsWith(prefix)) {
-                        return window.prefixColors[prefix];
-                    }
-                }
-                
-                return "#3388ff";
-            };
-            
-            window.colorizeMap = function() {
-                function applyColors() {
-                    var svgElements = document.querySelectorAll('#map-container svg');
-                    
-                    if (svgElements.length === 0) {
-                        setTimeout(applyColors, 500);
-                        return;
-                    }
-                    
-                    for (var i = 0; i < svgElements.length; i++) {
-                        var paths = svgElements[i].querySelectorAll('path');
-                        
-                        for (var j = 0; j < paths.length; j++) {
-                            var path = paths[j];
-                            var role = path.getAttribute('data-role');
-                            var pathData = path.getAttribute('d');
-                            var isPolygon = pathData && pathData.toLowerCase().indexOf('z') !== -1;
-                            
-                            if (role) {
-                                var color = window.getColor(role);
-                                path.setAttribute('stroke', color);
-                                path.setAttribute('stroke-width', '2');
-                                
-                                if (!isPolygon || role.startsWith('highway:') || role.startsWith('railway:') || role.startsWith('waterway:')) {
-                                    path.setAttribute('fill', 'none');
-                                    path.setAttribute('fill-opacity', '0');
-                                } else {
-                                    path.setAttribute('fill', color);
-                                    path.setAttribute('fill-opacity', '0.2');
-                                }
-                            }
-                            else if (path.classList.contains('leaflet-interactive')) {
-                                var colors = [
-                                    "#ff8080", "#a0c8a0", "#c0c0ff", "#804000", "#ff0000",
-                                    "#000000", "#a05000", "#c08060", "#ffc080", "#f0c0c0",
-                                    "#0080ff", "#c8c8c8", "#ffff00", "#ff00ff", "#800080",
-                                    "#0000ff", "#ffc0c0", "#404040", "#ff8000", "#00c0ff"
-                                ];
-                                
-                                var colorIndex = j % colors.length;
-                                var color = colors[colorIndex];
-                                
-                                path.setAttribute('stroke', color);
-                                path.setAttribute('stroke-width', '2');
-                                
-                                if (!isPolygon) {
-                                    path.setAttribute('fill', 'none');
-                                    path.setAttribute('fill-opacity', '0');
-                                } else {
-                                    path.setAttribute('fill', color);
-                                    path.setAttribute('fill-opacity', '0.2');
-                                }
-                            }
-                        }
-                    }
-                }
-                
-                setTimeout(applyColors, 100);
-            };
-            
-            if (!window._leafletEventsPatched) {
-                window._leafletEventsPatched = true;
-                
-                var originalInitPath = L.SVG.prototype._initPath;
-                
-                L.SVG.prototype._initPath = function(layer) {
-                    originalInitPath.call(this, layer);
-                    
-                    if (layer.feature && layer.feature.properties && layer.feature.properties.role) {
-                        var role = layer.feature.properties.role;
-                        var color = window.getColor(role);
-                        
-                        layer._path.setAttribute('data-role', role);
-                        
-                        var geometryType = '';
-                        if (layer.feature && layer.feature.geometry) {
-                            geometryType = layer.feature.geometry.type;
-                        }
-                        
-                        layer._path.setAttribute('stroke', color);
-                        layer._path.setAttribute('stroke-width', '2');
-                        
-                        if (geometryType === 'LineString' || geometryType === 'MultiLineString') {
-                            layer._path.setAttribute('fill', 'none');
-                            layer._path.setAttribute('fill-opacity', '0');
-                        } else {
-                            layer._path.setAttribute('fill', color);
-                            layer._path.setAttribute('fill-opacity', '0.2');
-                        }
-                    }
-                };
-                
-                var originalUpdateStyle = L.Path.prototype._updateStyle;
-                
-                L.Path.prototype._updateStyle = function() {
-                    originalUpdateStyle.call(this);
-                    
-                    if (this.feature && this.feature.properties && this.feature.properties.role) {
-                        var role = this.feature.properties.role;
-                        var color = window.getColor(role);
-                        
-                        var geometryType = '';
-                        if (this.feature && this.feature.geometry) {
-                            geometryType = this.feature.geometry.type;
-                        }
-                        
-                        this._path.setAttribute('stroke', color);
-                        this._path.setAttribute('stroke-width', '2');
-                        
-                        if (geometryType === 'LineString' || geometryType === 'MultiLineString') {
-                            this._path.setAttribute('fill', 'none');
-                            this._path.setAttribute('fill-opacity', '0');
-                        } else {
-                            this._path.setAttribute('fill', color);
-                            this._path.setAttribute('fill-opacity', '0.2');
-                        }
-                    }
-                };
-            }
-            """)
-
-            geo_json_str = json.dumps(geo_objects)
-            geo_json_obj = js.JSON.parse(geo_json_str)
-
-            def feature_handler_with_role(feature, layer):
-                try:
-                    self.feature_interaction_handler(feature, layer)
-                    
-                    js.eval("""
-                    function setStyleByRole(feature, layer) {
-                        if (feature.properties && feature.properties.role) {
-                            var role = feature.properties.role;
-                            var color = window.getColor(role);
-                            
-                            if (layer.setStyle) {
-                                layer.setStyle({
-                                    color: color,
-                                    weight: 2,
-                                    opacity: 0.7,
-                                    fillColor: color,
-                                    fillOpacity: 0.2
-                                });
-                            }
-                            
-                            if (layer._path) {
-                                layer._path.setAttribute('data-role', role);
-                                layer._path.setAttribute('stroke', color);
-                                layer._path.setAttribute('fill', color);
-                            }
-                        }
-                    }
-                    """)
-                    
-                    js.eval("setStyleByRole(feature, layer)")
-                except Exception as e:
-                    log(f"Error in feature handler: {e}")
-            
-            feature_handler_proxy = create_proxy(feature_handler_with_role)
+    def _visible_geo_objects(self, geo_objects):
+        """
+        Cut a FeatureCollection down to the features near the current viewport
 
-            try:
-                layer = js.L.geoJSON(geo_json_obj, {
-                    "onEachFeature": feature_handler_proxy
-                })
-            except Exception as e:
-                log(f"Error creating GeoJSON layer: {e}")
-                return
+        Args:
+            geo_objects: GeoJSON FeatureCollection dictionary
 
-            layer.addTo(self.map)
-            self.layers['main'] = layer
-            
-            js.window.colorizeMap()
-            
-            js.eval("""
-            setTimeout(window.colorizeMap, 500);
-            setTimeout(window.colorizeMap, 1000);
-            setTimeout(window.colorizeMap, 2000);
-            """)
+        Returns:
+            FeatureCollection holding only features whose bounding box meets the
+            map bounds padded by half a screen on each side
+        """
+        features = geo_objects.get("features") if isinstance(geo_objects, dict) else None
+        if features is None:
+            self._filled_bounds = None
+            return geo_objects
+
+        if geo_objects is not self._geo_source:
+            self._geo_source = geo_objects
+            self._geo_bboxes = [(_feature_bbox(feature), feature) for feature in features]
+            _window.setRoleColors(to_js(self._build_role_color_table(features), dict_converter=_from_entries))
+
+        bounds = self.map.getBounds().pad(0.5)
+        self._filled_bounds = bounds
+        west, south = bounds.getWest(), bounds.getSouth()
+        east, north = bounds.getEast(), bounds.getNorth()
+
+        visible = [feature for bbox, feature in self._geo_bboxes
+                   if bbox is None or (bbox[0] <= east and bbox[2] >= west
+                                       and bbox[1] <= north and bbox[3] >= south)]
+        return {"type": "FeatureCollection", "features": visible}
+
+    def _patch_feature_layers(self, layer, features):
+        """
+        Bring the GeoJSON layer in line with a feature list, touching only what changed
 
-            if not preserve_zoom:
-                try:
-                    bounds = layer.getBounds()
-                    if bounds and hasattr(bounds, 'isValid') and bounds.isValid():
-                        self.map.fitBounds(bounds)
-                except Exception as e:
-                    log(f"Could not fit map to bounds: {e}")
+        Args:
+            layer: The main L.geoJSON layer
+            features: List of GeoJSON Feature dictionaries to show
+        """
+        index = self._feature_layers
+        kept = {}
+        to_add = []
+        seen = set()
+
+        for feature in features:
+            key = _feature_key(feature)
+            if key in seen:
+                # Features sharing an id are the same object; a second layer
+                # under that key would be orphaned once the index is rebuilt
+                continue
+            seen.add(key)
+            entry = index.pop(key, None)
+            if entry is not None and (entry[0] is feature or entry[0] == feature):
+                kept[key] = entry
+                continue
+            if entry is not None:
+                layer.removeLayer(entry[1])
+                self._features_by_layer.pop(_L.stamp(entry[1]), None)
+            to_add.append((key, feature))
+
+        for _, sublayer in index.values():
+            layer.removeLayer(sublayer)
+            self._features_by_layer.pop(_L.stamp(sublayer), None)
+
+        # Queued features never made it into the index, so the diff above has
+        # already re-queued the ones that are still wanted
+        self._feature_layers = kept
+        self._pending_features = to_add
+        self._cancel_feature_chunk()
+        self._add_feature_chunk()
+
+    def _cancel_feature_chunk(self):
+        """Cancel the scheduled feature batch, if any"""
+        if self._chunk_handle is None:
+            return
+        if _HAS_IDLE_CALLBACK:
+            _window.cancelIdleCallback(self._chunk_handle)
+        else:
+            js.clearTimeout(self._chunk_handle)
+        self._chunk_handle = None
+
+    def _add_feature_chunk(self, deadline=None):
+        """
+        Add the next batch of queued features to the main layer
+
+        Args:
+            deadline: IdleDeadline passed by requestIdleCallback (unused)
+        """
+        self._chunk_handle = None
+        if not self.map or not self._pending_features:
+            return
+
+        batch = self._pending_features[:_FEATURE_CHUNK_SIZE]
+        del self._pending_features[:_FEATURE_CHUNK_SIZE]
+
+        layer = self.layers['main']
+        add_feature_layer = _window.addFeatureLayer
+        updating, self._updating_map = self._updating_map, True
+        try:
+            for key, feature in batch:
+                sublayer = add_feature_layer(layer, to_js(_leaflet_feature(feature), dict_converter=_from_entries))
+                if sublayer:
+                    self._feature_layers[key] = (feature, sublayer)
+                    self._features_by_layer[_L.stamp(sublayer)] = feature
+        except Exception as e:
+            error(f"Error adding features to the map: {e}")
+        finally:
+            self._updating_map = updating
+
+        if self._pending_features:
+            if _HAS_IDLE_CALLBACK:
+                self._chunk_handle = _window.requestIdleCallback(self._add_chunk_proxy)
             else:
-                if current_zoom is not None and current_center is not None:
-                    try:
-                        self.map.setView([current_center.lat, current_center.lng], current_zoom)
-                    except Exception as e:
-                        log(f"Error restoring zoom and center: {e}")
+                self._chunk_handle = js.setTimeout(self._add_chunk_proxy, 0)
+        elif self._fit_after_fill:
+            self._fit_after_fill = False
+            self._fit_to_geo_layer()
+
+    def _fit_to_geo_layer(self):
+        """Fit the map to the bounds of the main GeoJSON layer"""
+        try:
+            bounds = self.layers['main'].getBounds()
+            if bounds is not None and bounds.isValid():
+                self.map.fitBounds(bounds)
+        except Exception as e:
+            log(f"Could not fit map to bounds: {e}")
+
+    def update_geo_layers(self, geo_objects, preserve_zoom=False):
+        try:
+            if isinstance(geo_objects, str):
+                # Raw GeoJSON text becomes a dict so role colours, the viewport
+                # filter and the click index all apply; json.loads builds it
+                # directly instead of converting a parsed JS object node by node
+                geo_objects = json.loads(geo_objects)
+
+            collection = self._visible_geo_objects(geo_objects)
+            features = collection.get("features") if isinstance(collection, dict) else None
+
+            layer = self.layers['main']
 
             try:
-                feature_handler_proxy.destroy()
+                if features is None:
+                    layer.clearLayers()
+                    self._feature_layers = {}
+                    self._features_by_layer = {}
+                    self._pending_features = []
+                    self._cancel_feature_chunk()
+                    if isinstance(collection, dict):
+                        table = self._build_role_color_table([collection])
+                        _window.setRoleColors(to_js(table, dict_converter=_from_entries))
+                    if isinstance(collection, dict) and collection.get("type") == "Feature":
+                        sublayer = _window.addFeatureLayer(
+                            layer, to_js(_leaflet_feature(collection), dict_converter=_from_entries))
+                        if sublayer:
+                            self._features_by_layer[_L.stamp(sublayer)] = collection
+                    else:
+                        layer.addData(to_js(collection, dict_converter=_from_entries))
+                else:
+                    self._patch_feature_layers(layer, features)
             except Exception as e:
-                log(f"Error destroying proxy: {e}")
+                log(f"Error updating GeoJSON layer: {e}")
+                return
+
+            if not preserve_zoom:
+                if self._pending_features:
+                    self._fit_after_fill = True
+                else:
+                    self._fit_to_geo_layer()
 
         except Exception as e:
             import traceback
             log(f"Error updating geo layers: {str(e)}")
             log(traceback.format_exc())
 
-    def _on_feature_click(self, event, feature):
+    def _source_feature(self, slim):
         """
-        Обработчик клика по объекту на карте
+        Find the full feature of the current geo payload that a slim Leaflet copy was made from
+
+        Args:
+            slim: Feature dictionary as stored on the Leaflet layer
+
+        Returns:
+            Full GeoJSON Feature dictionary or None if the payload has no feature with that key
         """
-        try:
-            log(f"Feature clicked: {feature.get('properties', {}).get('name', 'Unknown')}")
-            
-            event.stopPropagation()
-            
-            from ..actions.geo_actions import GeoActions
-            GeoActions.select_geo_object(feature)
-            
-            from ..store.app_store import AppStore
-            store = AppStore()
-            state = store.get_state()
-            
-            if not state.get("info_panel_open", False):
-                from ..dispatch.dispatcher import Dispatcher
-                dispatcher = Dispatcher()
-                dispatcher.dispatch("TOGGLE_INFO_PANEL", True)
-        except Exception as e:
-            error(f"Error in feature click handler: {e}")
+        key = _feature_key(slim)
+        for _, feature in self._geo_bboxes:
+            if _feature_key(feature) == key:
+                return feature
+        return None
 
-    def feature_interaction_handler(self, feature, layer):
+    def _on_feature_click(self, event):
         """
-        Handle interactions for each feature.
+        Handle a click on any feature of the main GeoJSON layer
 
         Args:
-            feature: The feature to attach events
-            layer: The Leaflet layer
+            event: Leaflet click event; event.layer is the clicked feature layer
         """
         try:
-            click_handler = create_proxy(lambda e, feature=feature: self._on_feature_click(e, feature))
-            layer.on("click", click_handler)
-            
-            if not hasattr(layer, '_click_handlers'):
-                layer._click_handlers = []
-            layer._click_handlers.append(click_handler)
-        except Exception as e:
-            error(f"Error setting up feature interaction: {e}")
+            _L.DomEvent.stopPropagation(event)
+
+            layer = getattr(event, "layer", None) or event.sourceTarget
+            feature = self._features_by_layer.get(_L.stamp(layer))
+            if feature is None:
+                feature = self._source_feature(layer.feature.to_py())
+            if feature is None:
+                warn("Clicked feature is not in the current geo data")
+                return
+            log(f"Feature clicked: {feature.get('properties', {}).get('name', 'Unknown')}")
 
+            GeoActions.select_geo_object(feature)
+
+            if not self.store.get_state().get("info_panel_open", False):
+                dispatcher = Dispatcher()
+                dispatcher.dispatch("TOGGLE_INFO_PANEL", True)
+        except Exception as e:
+            error(f"Error in feature click handler: {e}")
 
     def highlight_selected_object(self, selected_object, preserve_zoom=False):
         """
@@ -538,27 +815,16 @@ class MapView:
         """
         self.clear_selection()
 
-        if preserve_zoom and self.map:
-            current_zoom = self.map.getZoom()
-            current_center = self.map.getCenter()
-
         try:
-            if isinstance(selected_object, str):
-                selected_object = json.loads(selected_object)
+            selected_js = to_js(_leaflet_feature(selected_object), dict_converter=_from_entries)
 
             properties = selected_object.get("properties", {})
             role = properties.get("role", "")
             base_color = self._get_color_for_role(role)
 
-            highlight_style = {
-                "color": "#ff0000",
-                "weight": 4,
-                "opacity": 1,
-                "fillColor": base_color,
-                "fillOpacity": 0.5
-            }
+            self._highlight_options.style.fillColor = base_color
 
-            self.selected_layer = js.L.geoJSON(selected_object, {"style": highlight_style})
+            self.selected_layer = _L.geoJSON(selected_js, self._highlight_options)
 
             self.selected_layer.addTo(self.map)
             self.selected_layer.bringToFront()
@@ -567,12 +833,6 @@ class MapView:
                 bounds = self.selected_layer.getBounds()
                 if bounds.isValid():
                     self.map.fitBounds(bounds, {"padding": [50, 50]})
-            else:
-                if 'current_zoom' in locals() and 'current_center' in locals():
-                    try:
-                        self.map.setView([current_center.lat, current_center.lng], current_zoom)
-                    except Exception as e:
-                        error(f"Error restoring zoom and center: {e}")
 
         except Exception as e:
             error(f"Error highlighting selected object: {str(e)}")
@@ -586,6 +846,21 @@ class MapView:
                 error(f"Error clearing selection: {e}")
             self.selected_layer = None
 
+    def _on_map_event(self, event):
+        """
+        Route a map event to its handler
+
+        Args:
+            event: Leaflet event for one of _MAP_EVENTS
+        """
+        event_type = event.type
+        if event_type == "moveend":
+            self.on_map_move(event)
+        elif event_type == "click":
+            self.on_map_click(event)
+        elif event_type == "zoomend":
+            self.on_map_zoom(event)
+
     def on_map_click(self, event):
         """
         Handle map click event
@@ -604,7 +879,8 @@ class MapView:
 
     def on_map_zoom(self, event):
         """
-        Handle map zoom event
+        Handle map zoom event. Leaflet fires moveend after every zoomend, so
+        the view is committed from on_map_move alone.
 
         Args:
             event: Leaflet zoom event
@@ -612,18 +888,6 @@ class MapView:
 
         if self._updating_map:
             log("Ignoring zoom event during programmatic update")
-            return
-
-        center = self.map.getCenter()
-        zoom = self.map.getZoom()
-        self._updating_map = True
-        try:
-            CityActions.update_map_view(
-                [center.lat, center.lng],
-                zoom
-            )
-        finally:
-            self._updating_map = False
 
     def on_map_move(self, event):
         """
@@ -637,6 +901,20 @@ class MapView:
             log("Ignoring move event during programmatic update")
             return
 
+        self._schedule_view_commit()
+
+    def _schedule_view_commit(self):
+        """Restart the timer that commits the map view to the store"""
+        if self._move_timer is not None:
+            js.clearTimeout(self._move_timer)
+        self._move_timer = js.setTimeout(self._commit_view_proxy, _VIEW_COMMIT_DELAY_MS)
+
+    def _commit_view(self):
+        """Push the current map center and zoom to the store"""
+        self._move_timer = None
+        if not self.map:
+            return
+
         center = self.map.getCenter()
         zoom = self.map.getZoom()
         self._updating_map = True
@@ -647,3 +925,14 @@ class MapView:
             )
         finally:
             self._updating_map = False
+
+        self._refill_if_view_left_bounds()
+
+    def _refill_if_view_left_bounds(self):
+        """Re-filter the geo layer when the view no longer fits inside the filled area"""
+        if "geo" in self._pending_renders:
+            # The queued geo update filters against the view at flush time
+            return
+        if self._filled_bounds is not None and not self._filled_bounds.contains(self.map.getBounds()):
+            source = self._geo_source
+            self._schedule_render("geo", lambda: self.update_geo_layers(source, preserve_zoom=True))
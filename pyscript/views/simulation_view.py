@@ -26,6 +26,7 @@ class SimulationView:
         self.screen = js.document.getElementById(screen_id)
         self.back_button_id = back_button_id
         self.back_button = js.document.getElementById(back_button_id)
+        self.home_screen = None
 
         self.store = AppStore()
         self.map_view = None
@@ -35,6 +36,7 @@ class SimulationView:
         self.initialized = False
         self.unsubscribe = None
         self._handlers = {}
+        self._title_elems = {}
 
     def initialize(self):
         """Initialize the component and its sub-components"""
@@ -42,6 +44,8 @@ class SimulationView:
             warn(f"Warning: Screen element {self.screen_id} not found in the DOM")
             return
 
+        self.home_screen = js.document.getElementById("home-screen")
+
         back_handler = create_proxy(self._on_back_button)
         self._handlers["back"] = back_handler
         self.back_button.addEventListener("click", back_handler)
@@ -148,7 +152,11 @@ class SimulationView:
             mode_id: ID of the selected mode
         """
         if self.info_panel:
-            title_elem = js.document.querySelector(f"#{self.info_panel.panel_id} > h2")
+            panel_id = self.info_panel.panel_id
+            title_elem = self._title_elems.get(panel_id)
+            if title_elem is None:
+                title_elem = js.document.querySelector(f"#{panel_id} > h2")
+                self._title_elems[panel_id] = title_elem
             if title_elem:
                 current_lang = js.document.documentElement.lang or "en"
                 
@@ -173,8 +181,7 @@ class SimulationView:
 
         self.screen.classList.remove("active")
 
-        home_screen = js.document.getElementById("home-screen")
-        home_screen.classList.add("active")
+        self.home_screen.classList.add("active")
 
         from ..dispatch.dispatcher import Dispatcher
         dispatcher = Dispatcher()